@@ -11,44 +11,31 @@ before considering average scores across all cuts. In this sense, it's more suit
 games rather than a tournament type of setting (multiple-eliminations, best of __ games, etc.).
 """
 
+from itertools import combinations
+
 import crib
 Card = crib.Card
 
+DISCARDS = tuple(combinations(range(6), 2)) # the 15 (i, j) index pairs of a 6 card deal that can be discarded
+KEEPS = tuple(tuple(k for k in range(6) if k != i and k != j) for i, j in DISCARDS) # the hand indices kept for each of DISCARDS
+DECK = tuple(Card.make_deck()) # built once, in make_deck() order, for every cut_prune() call
+_SUITS = {"S": crib.SPADE, "C": crib.CLUB, "H": crib.HEART, "D": crib.DIAMOND} # suit letters accepted by str_to_card()
+_VALUES = frozenset(Card.values)
+
 def str_to_card(string):
     """Returns a card from a string of the form 'value/suit'"""
     card = string.split("/")
+    if len(card) != 2:
+        raise ValueError
     value = card[0]
-    suit = card[1]
-    if suit not in ["S", "C", "H", "D"] or value not in Card.values:
-        raise ValueError 
-    if suit == "S":
-        suit = crib.SPADE
-    elif suit == "C":
-      suit = crib.CLUB
-    elif suit == "H":
-        suit = crib.HEART
-    elif suit == "D":
-        suit = crib.DIAMOND
-    
-    return Card(value, suit)
-
-def score(hand):
-    """Returns the score of a hand."""
-    total = 0
-    combos = crib.get_combos(hand)
-    fifteens = crib.fifteens(hand, combos)
-    run, multiplicity = crib.runs(hand, combos)
-    pairs = crib.pairs(hand, combos)
-    flush = crib.suit_flush(hand[0:5])
+    if value not in _VALUES:
+        raise ValueError
+    try:
+        suit = _SUITS[card[1]]
+    except KeyError:
+        raise ValueError from None
 
-    total += len(fifteens) * 2
-    total += len(pairs) * 2
-    total += 4 * flush
-    if len(hand) == 5:
-        total += crib.suit_flush(hand) # i.e. in-hand flush worth 4, hand + cut flush worth 5
-    total += len(run) * multiplicity
-
-    return total
+    return Card(value, suit)
 
 def crib_prune(bests, yours):
     """Helper function for discard() which prunes the bests list based on the potential of discarded cards."""
@@ -77,52 +64,37 @@ def crib_prune(bests, yours):
             
         if best[1][0].value == "J" or best[1][1].value == "J":
             best[2] += multiplier * .5
-    bests = sorted(bests, key=lambda x: x[2]) # sort by score
-    while bests[-1][2] < bests[0][2]:
-        bests.pop() # then prune to highest
+    highest = max([best[2] for best in bests])
+    bests = [best for best in bests if best[2] == highest] # prune to highest, keeping ties
 
     return bests
 
 def cut_prune(bests):
     """Helper function for discard() which prunes bests list based on all possible cuts."""
-    deck = Card.make_deck()
     # cards in hand (hand + discards for any bests[i]) can't be cuts
-    used = bests[0][0]
-    used.extend(bests[0][1])
-    for card1 in deck:
-        for card2 in used:
-            if card1 == card2:
-                deck.remove(card1)
-
+    used = set(bests[0][0]) | set(bests[0][1])
+    cuts = crib.pack([card for card in DECK if card not in used])
     for best in bests:
-        average = 0
-        for card in deck:
-            hand = best[0]
-            hand.append(card)
-            average += score(hand)
-            hand.pop()
-        average /= 46.0
-        best[2] = average
-
-    bests = sorted(bests, key=lambda x: x[2])
-    while bests[-1][2] < bests[0][2]:
-        bests.pop()
+        # every cut is scored against the hand in one batch
+        best[2] = crib.score_cuts(crib.pack(best[0]), cuts) / len(cuts)
+
+    highest = max([best[2] for best in bests])
+    bests = [best for best in bests if best[2] == highest]
 
     return bests
 
 def discard(deal, yours):
     """Gives the best discards given a 6 card deal. yours = True means the crib is counted for the hand; False, against the hand."""
-    bests = [[[], [], 0]] # list of lists: each element is (hand, discards, score)
-
-    for i in range(6):
-        for j in range(i+1, 6):
-            hand = [card for card in deal if deal.index(card) != i and deal.index(card) != j]
-            points = score(hand)
-            if points > bests[0][2]:
-                # clear bests if score is higher and add new hand
-                bests = [[hand, [deal[i], deal[j]], points]]
-            elif points == bests[0][2]:
-                bests.append([hand, [deal[i], deal[j]], points])
+    if len(deal) != 6:
+        raise ValueError
+    # the deal is packed once and every kept hand is picked out of it, so no hand is packed on its own
+    packed = crib.pack(deal)
+    points = [crib.score_lookup(tuple(packed[k] for k in keep)) for keep in KEEPS]
+    highest = max(points)
+
+    # list of lists: each element is (hand, discards, score), keeping ties in deal order
+    bests = [[tuple(deal[k] for k in keep), (deal[i], deal[j]), highest]
+             for keep, (i, j), p in zip(KEEPS, DISCARDS, points) if p == highest]
 
     # now prune bests list as best as possible (note that the score field of each 'best' is now skewed from pruning functions)
     if len(bests) > 1:
@@ -6,13 +6,23 @@ which also has some binary operations defined on it.
 Also has several functions pertaining directly to cribbage so as to
 ease calculations, as well as constants SPADE, HEART, DIAMOND, and CLUB
 which point to the unicode characters for the suit symbols.
+The scoring functions work on packed hands (see pack()), where every card is a
+single small int rather than a Card object. Since the score of a hand before
+flushes depends only on its values, the few thousand possible 4 and 5 card
+value combinations are scored once at import (RANK_SCORES) and hands are then
+scored by lookup.
 """
 
+import operator
+from itertools import combinations_with_replacement
+
 SPADE = "\N{BLACK SPADE SUIT}"
 HEART = "\N{BLACK HEART SUIT}"
 DIAMOND = "\N{BLACK DIAMOND SUIT}"
 CLUB = "\N{BLACK CLUB SUIT}"
 
+RANK = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10) # point value of each value index (given by Card.values)
+
 class Card:
     """
     A simple card class, whose attributes and methods are minimum for what cribbage requires.
@@ -20,12 +30,15 @@ class Card:
     """
     values = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
     suits = [SPADE, HEART, DIAMOND, CLUB]
+    __slots__ = ("_value", "_suit", "_idx", "_suit_idx")
     
     def __init__(self, value, suit):
         assert value in Card.values, "Invalid card value"
         assert suit in Card.suits, "Invalid card suit"
         self._value = value
         self._suit = suit
+        self._idx = Card.values.index(value) # looked up once here rather than on every use
+        self._suit_idx = Card.suits.index(suit)
 
     @property
     def value(self):
@@ -39,7 +52,10 @@ class Card:
         return "[{}|{}]".format(self._value, self._suit)
 
     def __eq__(self, other):
-        return self.value == other.value and self.suit == other.suit
+        return self._idx == other._idx and self._suit_idx == other._suit_idx
+
+    def __hash__(self):
+        return self._suit_idx << 4 | self._idx
 
     def same_value(self, other):
         """Returns true when card values are the same."""
@@ -54,15 +70,14 @@ class Card:
         return self.suit == other.suit
 
     def val_to_int(self):
-        if self._value in Card.values[1:10]:
-            return int(self._value)
-        elif self._value == "A":
-            return 1
-        else:
-            return 10
+        return RANK[self._idx]
 
     def val_to_index(self):
-        return Card.values.index(self._value)
+        return self._idx
+
+    def __index__(self):
+        """Returns the card packed into one byte: value index in bits 0-3, suit index in bits 4-5."""
+        return self._suit_idx << 4 | self._idx
 
     @classmethod
     def make_deck(cls):
@@ -74,76 +89,101 @@ class Card:
 
         return deck 
 
-def get_combos(hand):
-    """Returns a list of all combinations of cards (list of lists)"""
-    combos = []
-    size = len(hand)
-    
-    for i in range(size):
-        for j in range(i+1, size):
-            # add all pairs...
-            combos.append([i, j])
-            for k in range(j+1, size):
-                # and triples..
-                combos.append([i, j, k])
-                for l in range(k+1, size):
-                    # and quadruples...
-                    combos.append([i, j, k, l])
-    # and finally the whole hand, if including cut card
-    if size == 5:
-        combos.append([i for i in range(size)])
-
-    return combos
-
-def fifteens(hand, combos):
-    """Returns the combinations summing to 15 (list of lists) in hand (list of size 4 or 5) given all combinations"""
-    valid = []
-
-    for combo in combos:
-        total = 0
-        for i in combo:
-            total += hand[i].val_to_int()
-        if total == 15:
-            valid.append(combo)
-
-    return valid
-
-def runs(hand, combos):
-    """Returns the largest run in hand (there is only one, since run is minimum 3 cards), along with how many duplicates there are."""
-    current_best = [] # will store the largest run given by values in index form (given by Card.values)
-    val_indices = [] # stores the sequence of indices for current combo being processed
-    multiplicity = 1 # stores the number of "duplicate" runs
-
-    for combo in combos:
-        if len(combo) >= 3:
-            val_indices = sorted([hand[i].val_to_index() for i in combo])
-            consecutive = True
-            for i in val_indices[0:len(val_indices) - 1]:
-                if i+1 not in val_indices or val_indices.count(i) > 1:
-                    consecutive = False
-            if consecutive == True:
-                if len(val_indices) > len(current_best):
-                    multiplicity = 1
-                    current_best = val_indices
-                elif len(val_indices) == len(current_best):
-                    multiplicity += 1
-
-    return current_best, multiplicity
-
-def pairs(hand, combos):
-    """Returns all pairs in hand as combinations of hand indices."""
-    pairs = []
-    for combo in combos:
-        if len(combo) == 2:
-            if hand[combo[0]].value == hand[combo[1]].value:
-                pairs.append(combo)
-    
-    return pairs
+def pack(hand):
+    """Returns hand (list of cards) as a tuple of packed cards (ints, see Card.__index__)."""
+    return tuple(operator.index(card) for card in hand)
+
+def fifteens(hand):
+    """Returns the number of combinations summing to 15 in packed hand (size 4 or 5)."""
+    sums = [0] # sums of every subset of the cards seen so far (2^n of them by the end)
+
+    for card in hand:
+        value = RANK[card & 0x0F]
+        sums += [total + value for total in sums]
+
+    return sums.count(15) # no single card is worth 15, so every match is 2+ cards
 
 def suit_flush(hand):
-    """Returns 1 if all cards in hand are of the same suit, 0 otherwise."""
-    suit = hand[0].suit
-    for card in hand[1:]:
-        if card.suit != suit:
-            return 0
-    return 1
\ No newline at end of file
+    """Returns 1 if all cards in packed hand are of the same suit, 0 otherwise."""
+    suits = 0 # bit s set when suit index s is in the hand
+    for card in hand:
+        suits |= 1 << (card >> 4)
+    return int(suits & (suits - 1) == 0) # i.e. exactly one bit set
+
+def longest_run(counts, mask):
+    """
+    Returns (start, length, multiplicity) of the run in a hand, given the number of cards of each value index
+    and a bitmask of the value indices present, or (0, 0, 0) if it has no run of 3 or more.
+    """
+    # each pass keeps only the bits that start a stretch of set bits one longer than the last pass,
+    # so the number of passes is the longest stretch and the last non-zero mask marks where it starts
+    length = 0
+    starts = 0
+    while mask:
+        starts = mask
+        mask &= mask >> 1
+        length += 1
+    if length < 3: # and at most one stretch this long fits in 5 cards
+        return 0, 0, 0
+
+    start = 0
+    while not starts >> start & 1:
+        start += 1
+    multiplicity = 1 # number of distinct runs over the stretch
+    for i in range(start, start + length):
+        multiplicity *= counts[i]
+
+    return start, length, multiplicity
+
+def score_hand(hand):
+    """Returns the score of packed hand (size 4 or 5)."""
+    return score_values(hand) + len(hand) * suit_flush(hand) # i.e. in-hand flush worth 4, hand + cut flush worth 5
+
+def score_values(hand):
+    """Returns the score of packed hand (size 4 or 5) without flushes, found from its value counts instead of walking its combinations."""
+    counts = [0] * 13 # number of cards of each value index
+    mask = 0 # bit i set when value index i is in the hand
+    for card in hand:
+        counts[card & 0x0F] += 1
+        mask |= 1 << (card & 0x0F)
+
+    total = fifteens(hand) * 2
+    for count in counts:
+        total += count * (count - 1) # count choose 2 pairs, 2 points each
+    start, length, multiplicity = longest_run(counts, mask)
+    total += length * multiplicity
+
+    return total
+
+RANK_KEYS = tuple(1 << 3 * i for i in range(13)) # a 3 bit count per value index, so summing these over a hand gives its key
+
+def rank_key(hand):
+    """Returns the key of packed hand in RANK_SCORES: its value histogram packed into one int, whatever the card order."""
+    return sum([RANK_KEYS[card & 0x0F] for card in hand])
+
+def _rank_scores():
+    """Returns a dict from the key of every possible 4 and 5 card hand to its score without flushes."""
+    scores = {}
+    for size in (4, 5):
+        for values in combinations_with_replacement(range(13), size):
+            if values[0] == values[-1] and size == 5:
+                continue # there are only 4 cards of each value
+            scores[rank_key(values)] = score_values(values) # value indices are packed cards of the first suit
+
+    return scores
+
+RANK_SCORES = _rank_scores() # score_values() of every possible hand, keyed by rank_key()
+
+def score_lookup(hand):
+    """Returns the score of packed hand (size 4 or 5), equal to score_hand() but read from RANK_SCORES."""
+    return RANK_SCORES[rank_key(hand)] + len(hand) * suit_flush(hand) # i.e. in-hand flush worth 4, hand + cut flush worth 5
+
+def score_cuts(hand, cuts):
+    """Returns the total score of packed 4 card hand over every packed cut in cuts, i.e. the sum of score_lookup() of hand plus each cut."""
+    key = rank_key(hand)
+    total = sum([RANK_SCORES[key + RANK_KEYS[cut & 0x0F]] for cut in cuts])
+    if suit_flush(hand):
+        suit = hand[0] >> 4
+        total += 5 * len([cut for cut in cuts if cut >> 4 == suit])
+
+    return total
\ No newline at end of file
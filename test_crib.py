@@ -0,0 +1,43 @@
+# Tests for the scoring functions in crib. Run with: python -m unittest
+
+import random
+import unittest
+
+import crib
+
+DECK = crib.pack(crib.Card.make_deck())
+
+def card(value, suit):
+    """Returns the packed card for value and suit letter (as typed into the analyzer)."""
+    suits = {"S": crib.SPADE, "H": crib.HEART, "D": crib.DIAMOND, "C": crib.CLUB}
+    return crib.pack([crib.Card(value, suits[suit])])[0]
+
+class TestScoring(unittest.TestCase):
+
+    def test_known_hands(self):
+        five = (card("5", "S"), card("5", "H"), card("5", "D"), card("J", "C"))
+        self.assertEqual(crib.score_hand(five + (card("5", "C"),)), 28) # no nobs
+        self.assertEqual(crib.score_hand((card("A", "S"), card("2", "S"), card("3", "S"), card("4", "S"))), 8) # run of 4 and a flush
+        self.assertEqual(crib.score_hand((card("7", "H"), card("8", "H"), card("7", "D"), card("8", "C"))), 12)
+        self.assertEqual(crib.score_hand((card("2", "C"), card("4", "D"), card("6", "H"), card("8", "S"))), 0)
+
+    def test_score_lookup_matches_score_hand(self):
+        rng = random.Random(355)
+        for size in (4, 5):
+            for _ in range(5000):
+                hand = tuple(rng.sample(DECK, size))
+                self.assertEqual(crib.score_lookup(hand), crib.score_hand(hand), hand)
+        for suit in range(4): # flushes never come from the table
+            hand = tuple(suit << 4 | value for value in (0, 4, 7, 11, 2))
+            self.assertEqual(crib.score_lookup(hand[:4]), crib.score_hand(hand[:4]))
+            self.assertEqual(crib.score_lookup(hand), crib.score_hand(hand))
+
+    def test_score_cuts_matches_score_lookup(self):
+        rng = random.Random(355)
+        for _ in range(200):
+            hand = tuple(rng.sample(DECK, 4))
+            cuts = tuple(cut for cut in DECK if cut not in hand)
+            self.assertEqual(crib.score_cuts(hand, cuts), sum([crib.score_lookup(hand + (cut,)) for cut in cuts]))
+
+if __name__ == "__main__":
+    unittest.main()